@@ -22,6 +22,7 @@ from libc.stdint cimport uint64_t
 cpdef unix_nanos_to_dt(uint64_t nanos)
 cpdef dt_to_unix_nanos(dt: pd.Timestamp)
 cpdef str unix_nanos_to_iso8601(uint64_t unix_nanos, bint nanos_precision=*)
+cpdef uint64_t iso8601_to_unix_nanos(str value)
 cpdef str format_iso8601(datetime dt, bint nanos_precision=*)
 cpdef maybe_unix_nanos_to_dt(nanos)
 cpdef maybe_dt_to_unix_nanos(dt: pd.Timestamp)
@@ -33,6 +33,7 @@ UNIX_EPOCH: Final[pd.Timestamp]
 def unix_nanos_to_dt(nanos: int) -> pd.Timestamp: ...
 def dt_to_unix_nanos(dt: pd.Timestamp) -> int: ...
 def unix_nanos_to_iso8601(unix_nanos: int, nanos_precision: bool = True) -> str: ...
+def iso8601_to_unix_nanos(value: str) -> int: ...
 def format_iso8601(dt: datetime, nanos_precision: bool = True) -> str: ...
 def maybe_unix_nanos_to_dt(nanos: int | None) -> pd.Timestamp | None: ...
 def maybe_dt_to_unix_nanos(dt: pd.Timestamp | None) -> int | None: ...
@@ -35,6 +35,7 @@ from nautilus_trader.core.nautilus_pyo3 import secs_to_nanos as secs_to_nanos
 cimport cpython.datetime
 from cpython.datetime cimport datetime_tzinfo
 from cpython.unicode cimport PyUnicode_Contains
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -43,9 +44,17 @@ from nautilus_trader.core.rust.core cimport unix_nanos_to_iso8601_millis_cstr
 from nautilus_trader.core.string cimport cstr_to_pystr
 
 
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size)  # noqa
+
+
 # UNIX epoch is the UTC time at 00:00:00 on 1/1/1970
 # https://en.wikipedia.org/wiki/Unix_time
-cdef datetime UNIX_EPOCH = pd.Timestamp("1970-01-01", tz=pytz.utc)
+# Cache the UTC tzinfo singleton as a module constant to avoid the
+# module attribute lookup on hot conversion paths
+cdef object _UTC = pytz.utc
+
+cdef datetime UNIX_EPOCH = pd.Timestamp("1970-01-01", tz=_UTC)
 
 
 cpdef unix_nanos_to_dt(uint64_t nanos):
@@ -62,7 +71,7 @@ cpdef unix_nanos_to_dt(uint64_t nanos):
     pd.Timestamp
 
     """
-    return pd.Timestamp(nanos, unit="ns", tz=pytz.utc)
+    return pd.Timestamp(nanos, unit="ns", tz=_UTC)
 
 
 cpdef dt_to_unix_nanos(dt: pd.Timestamp):
@@ -114,6 +123,106 @@ cpdef str unix_nanos_to_iso8601(uint64_t unix_nanos, bint nanos_precision = True
         return cstr_to_pystr(unix_nanos_to_iso8601_millis_cstr(unix_nanos))
 
 
+cdef inline bint _is_digit(char c):
+    return c >= b'0' and c <= b'9'
+
+
+cdef bint _try_parse_fixed_iso8601(const char* s, Py_ssize_t n, uint64_t* nanos_out):
+    # Parse the fixed-layout 'YYYY-MM-DDTHH:MM:SS[.f{1,9}]Z' format,
+    # returning False if `s` does not match the layout exactly
+    if n < 20 or s[4] != b'-' or s[7] != b'-' or s[10] != b'T' or s[13] != b':' or s[16] != b':' or s[n - 1] != b'Z':
+        return False
+
+    cdef Py_ssize_t i
+    for i in range(19):
+        if i == 4 or i == 7 or i == 10 or i == 13 or i == 16:
+            continue
+        if not _is_digit(s[i]):
+            return False
+
+    cdef int year = (s[0] - <char>b'0') * 1000 + (s[1] - <char>b'0') * 100 + (s[2] - <char>b'0') * 10 + (s[3] - <char>b'0')
+    cdef int month = (s[5] - <char>b'0') * 10 + (s[6] - <char>b'0')
+    cdef int day = (s[8] - <char>b'0') * 10 + (s[9] - <char>b'0')
+    cdef int hour = (s[11] - <char>b'0') * 10 + (s[12] - <char>b'0')
+    cdef int minute = (s[14] - <char>b'0') * 10 + (s[15] - <char>b'0')
+    cdef int second = (s[17] - <char>b'0') * 10 + (s[18] - <char>b'0')
+
+    # Defer years outside the UNIX nanoseconds range to the fallback parser
+    if year < 1970 or year > 2200 or month < 1 or month > 12 or hour > 23 or minute > 59 or second > 59:
+        return False
+
+    cdef bint leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+    cdef int days_in_month = 31
+    if month == 2:
+        days_in_month = 29 if leap else 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        days_in_month = 30
+    if day < 1 or day > days_in_month:
+        return False
+
+    # Fractional seconds (up to nanosecond precision)
+    cdef uint64_t frac = 0
+    cdef Py_ssize_t frac_len = n - 21
+    if n > 20:
+        if s[19] != b'.' or frac_len < 1 or frac_len > 9:
+            return False
+        for i in range(20, n - 1):
+            if not _is_digit(s[i]):
+                return False
+            frac = frac * 10 + <uint64_t>(s[i] - <char>b'0')
+        for i in range(9 - frac_len):
+            frac *= 10
+
+    # Days from civil algorithm
+    # https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    cdef int y = year
+    if month <= 2:
+        y -= 1
+    cdef int era = y // 400
+    cdef int yoe = y - era * 400
+    cdef int mp = month - 3 if month > 2 else month + 9
+    cdef int doy = (153 * mp + 2) // 5 + day - 1
+    cdef int doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    cdef int64_t days = <int64_t>era * 146097 + doe - 719468
+
+    nanos_out[0] = (
+        <uint64_t>days * 86400
+        + <uint64_t>hour * 3600
+        + <uint64_t>minute * 60
+        + <uint64_t>second
+    ) * 1_000_000_000 + frac
+    return True
+
+
+cpdef uint64_t iso8601_to_unix_nanos(str value):
+    """
+    Return the UNIX timestamp (nanoseconds) for the given ISO 8601 (RFC 3339) format string.
+
+    The common fixed-layout 'YYYY-MM-DDTHH:MM:SS[.fffffffff]Z' format is parsed
+    directly without any intermediate datetime object, with all other valid
+    ISO 8601 inputs falling back to `pd.Timestamp` parsing.
+
+    Parameters
+    ----------
+    value : str
+        The ISO 8601 (RFC 3339) format string to parse.
+
+    Returns
+    -------
+    uint64_t
+
+    """
+    Condition.not_none(value, "value")
+
+    cdef Py_ssize_t n = 0
+    cdef const char* s = PyUnicode_AsUTF8AndSize(value, &n)
+    cdef uint64_t unix_nanos = 0
+    if _try_parse_fixed_iso8601(s, n, &unix_nanos):
+        return unix_nanos
+
+    return <uint64_t>pd.Timestamp(value, tz=_UTC).value
+
+
 cpdef str format_iso8601(datetime dt, bint nanos_precision = True):
     """
     Format the given datetime as an ISO 8601 (RFC 3339) specification string.
@@ -157,7 +266,7 @@ cpdef maybe_unix_nanos_to_dt(nanos):
     if nanos is None:
         return None
     else:
-        return pd.Timestamp(nanos, unit="ns", tz=pytz.utc)
+        return pd.Timestamp(nanos, unit="ns", tz=_UTC)
 
 
 cpdef maybe_dt_to_unix_nanos(dt: pd.Timestamp):
@@ -207,7 +316,7 @@ cpdef bint is_datetime_utc(datetime dt):
     """
     Condition.not_none(dt, "dt")
 
-    return datetime_tzinfo(dt) == pytz.utc
+    return datetime_tzinfo(dt) == _UTC
 
 
 cpdef bint is_tz_aware(time_object):
@@ -270,9 +379,9 @@ cpdef datetime as_utc_timestamp(datetime dt):
     Condition.not_none(datetime, "datetime")
 
     if dt.tzinfo is None:  # tz-naive
-        return pytz.utc.localize(dt)
-    elif dt.tzinfo != pytz.utc:
-        return dt.astimezone(pytz.utc)
+        return _UTC.localize(dt)
+    elif dt.tzinfo != _UTC:
+        return dt.astimezone(_UTC)
     else:
         return dt  # Already UTC
 
@@ -298,9 +407,9 @@ cpdef object as_utc_index(data: pd.DataFrame):
 
     # Ensure the index is localized to UTC
     if data.index.tzinfo is None:  # tz-naive
-        data = data.tz_localize(pytz.utc)
-    elif data.index.tzinfo != pytz.utc:
-        data = data.tz_convert(None).tz_localize(pytz.utc)
+        data = data.tz_localize(_UTC)
+    elif data.index.tzinfo != _UTC:
+        data = data.tz_convert(None).tz_localize(_UTC)
 
     # Check if the index is in nanosecond resolution, convert if not
     if not is_datetime64_ns_dtype(data.index.dtype):
@@ -26,6 +26,16 @@ from nautilus_trader.core.string cimport cstr_to_pystr
 from nautilus_trader.core.string cimport pystr_to_cstr
 
 
+cdef inline bint _is_uuid_hex(str value, Py_ssize_t start, Py_ssize_t end):
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    for i in range(start, end):
+        c = value[i]
+        if not ("0" <= c <= "9" or "a" <= c <= "f" or "A" <= c <= "F"):
+            return False
+    return True
+
+
 cdef class UUID4:
     """
     Represents a Universally Unique Identifier (UUID)
@@ -73,9 +83,28 @@ cdef class UUID4:
     @staticmethod
     cdef UUID4 from_str_c(str value):
         Condition.valid_string(value, "value")
-        uuid_obj = uuid.UUID(value)
-        Condition.is_true(uuid_obj.version == 4, "UUID value is not version 4")
-        Condition.is_true(uuid_obj.variant == uuid.RFC_4122, "UUID value is not RFC 4122")
+        # Validate the canonical 8-4-4-4-12 layout with a single scan rather
+        # than constructing a full uuid.UUID object per call, falling back to
+        # uuid.UUID for the non-canonical forms it accepts (hex, braces, URN)
+        cdef bint canonical = (
+            len(value) == 36
+            and value[8] == "-"
+            and value[13] == "-"
+            and value[18] == "-"
+            and value[23] == "-"
+            and _is_uuid_hex(value, 0, 8)
+            and _is_uuid_hex(value, 9, 13)
+            and _is_uuid_hex(value, 14, 18)
+            and _is_uuid_hex(value, 19, 23)
+            and _is_uuid_hex(value, 24, 36)
+        )
+        if canonical:
+            Condition.is_true(value[14] == "4", "UUID value is not version 4")
+            Condition.is_true(value[19] in "89abAB", "UUID value is not RFC 4122")
+        else:
+            uuid_obj = uuid.UUID(value)
+            Condition.is_true(uuid_obj.version == 4, "UUID value is not version 4")
+            Condition.is_true(uuid_obj.variant == uuid.RFC_4122, "UUID value is not RFC 4122")
 
         cdef UUID4 uuid4 = UUID4.__new__(UUID4)
         uuid4._mem = uuid4_from_cstr(pystr_to_cstr(value))
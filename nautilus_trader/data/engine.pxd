@@ -69,6 +69,7 @@ cdef class DataEngine(Component):
     cdef readonly dict[str, SnapshotInfo] _snapshot_info
     cdef readonly dict[UUID4, int] _query_group_n_components
     cdef readonly dict[UUID4, list] _query_group_components
+    cdef readonly dict[type, object] _data_type_handlers
 
     cdef readonly str _time_bars_interval_type
     cdef readonly bint _time_bars_timestamp_on_close
@@ -168,6 +169,7 @@ cdef class DataEngine(Component):
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
     cpdef void _handle_data(self, Data data)
+    cdef void _resolve_data_handler(self, Data data)
     cpdef void _handle_instrument(self, Instrument instrument, bint update_catalog=*)
     cpdef void _handle_order_book_delta(self, OrderBookDelta delta)
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas)
@@ -144,6 +144,7 @@ cdef class DataEngine(Component):
         self._snapshot_info: dict[str, SnapshotInfo] = {}
         self._query_group_n_components: dict[UUID4, int] = {}
         self._query_group_components: dict[UUID4, list] = {}
+        self._data_type_handlers: dict[type, object] = {}
 
         # Settings
         self.debug = config.debug
@@ -1755,28 +1756,41 @@ cdef class DataEngine(Component):
     cpdef void _handle_data(self, Data data):
         self.data_count += 1
 
+        # Dispatch on the exact data type, memoized on first sight so the
+        # isinstance ladder only runs once per concrete type
+        handler = self._data_type_handlers.get(type(data))
+        if handler is not None:
+            handler(data)
+        else:
+            self._resolve_data_handler(data)
+
+    cdef void _resolve_data_handler(self, Data data):
         if isinstance(data, OrderBookDelta):
-            self._handle_order_book_delta(data)
+            handler = self._handle_order_book_delta
         elif isinstance(data, OrderBookDeltas):
-            self._handle_order_book_deltas(data)
+            handler = self._handle_order_book_deltas
         elif isinstance(data, OrderBookDepth10):
-            self._handle_order_book_depth(data)
+            handler = self._handle_order_book_depth
         elif isinstance(data, QuoteTick):
-            self._handle_quote_tick(data)
+            handler = self._handle_quote_tick
         elif isinstance(data, TradeTick):
-            self._handle_trade_tick(data)
+            handler = self._handle_trade_tick
         elif isinstance(data, Bar):
-            self._handle_bar(data)
+            handler = self._handle_bar
         elif isinstance(data, Instrument):
-            self._handle_instrument(data)
+            handler = self._handle_instrument
         elif isinstance(data, InstrumentStatus):
-            self._handle_instrument_status(data)
+            handler = self._handle_instrument_status
         elif isinstance(data, InstrumentClose):
-            self._handle_close_price(data)
+            handler = self._handle_close_price
         elif isinstance(data, CustomData):
-            self._handle_custom_data(data)
+            handler = self._handle_custom_data
         else:
             self._log.error(f"Cannot handle data: unrecognized type {type(data)} {data}")
+            return
+
+        self._data_type_handlers[type(data)] = handler
+        handler(data)
 
     cpdef void _handle_instrument(self, Instrument instrument, bint update_catalog = False):
         self._cache.add_instrument(instrument)
@@ -56,6 +56,11 @@ class ExecutionReport(Document):
     The base class for all execution reports.
     """
 
+    __slots__ = (
+        "account_id",
+        "instrument_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -154,6 +159,36 @@ class OrderStatusReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "avg_px",
+        "cancel_reason",
+        "client_order_id",
+        "contingency_type",
+        "display_qty",
+        "expire_time",
+        "filled_qty",
+        "leaves_qty",
+        "limit_offset",
+        "order_list_id",
+        "order_side",
+        "order_status",
+        "order_type",
+        "post_only",
+        "price",
+        "quantity",
+        "reduce_only",
+        "time_in_force",
+        "trailing_offset",
+        "trailing_offset_type",
+        "trigger_price",
+        "trigger_type",
+        "ts_accepted",
+        "ts_last",
+        "ts_triggered",
+        "venue_order_id",
+        "venue_position_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -347,6 +382,19 @@ class FillReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "client_order_id",
+        "commission",
+        "last_px",
+        "last_qty",
+        "liquidity_side",
+        "order_side",
+        "trade_id",
+        "ts_event",
+        "venue_order_id",
+        "venue_position_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -442,6 +490,14 @@ class PositionStatusReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "position_side",
+        "quantity",
+        "signed_decimal_qty",
+        "ts_last",
+        "venue_position_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -504,6 +560,15 @@ class ExecutionMassStatus(Document):
 
     """
 
+    __slots__ = (
+        "_fill_reports",
+        "_order_reports",
+        "_position_reports",
+        "account_id",
+        "client_id",
+        "venue",
+    )
+
     def __init__(
         self,
         client_id: ClientId,
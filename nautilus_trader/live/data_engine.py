@@ -385,9 +385,15 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 command: DataCommand | None = await self._cmd_queue.get()
+                # Drain any further commands already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while command is not self._sentinel:
+                    self._execute_command(command)
+                    if self._cmd_queue.empty():
+                        break
+                    command = self._cmd_queue.get_nowait()
                 if command is self._sentinel:
                     break
-                self._execute_command(command)
         except asyncio.CancelledError:
             self._log.warning("DataCommand message queue canceled")
         except Exception as e:
@@ -406,9 +412,15 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 request: DataRequest | None = await self._req_queue.get()
+                # Drain any further requests already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while request is not self._sentinel:
+                    self._handle_request(request)
+                    if self._req_queue.empty():
+                        break
+                    request = self._req_queue.get_nowait()
                 if request is self._sentinel:
                     break
-                self._handle_request(request)
         except asyncio.CancelledError:
             self._log.warning("DataRequest message queue canceled")
         except Exception as e:
@@ -427,9 +439,15 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 response: DataResponse | None = await self._res_queue.get()
+                # Drain any further responses already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while response is not self._sentinel:
+                    self._handle_response(response)
+                    if self._res_queue.empty():
+                        break
+                    response = self._res_queue.get_nowait()
                 if response is self._sentinel:
                     break
-                self._handle_response(response)
         except asyncio.CancelledError:
             self._log.warning("DataResponse message queue canceled")
         except Exception as e:
@@ -446,9 +464,15 @@ class LiveDataEngine(DataEngine):
         try:
             while True:
                 data: Data | None = await self._data_queue.get()
+                # Drain any further data already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while data is not self._sentinel:
+                    self._handle_data(data)
+                    if self._data_queue.empty():
+                        break
+                    data = self._data_queue.get_nowait()
                 if data is self._sentinel:
                     break
-                self._handle_data(data)
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled")
         except Exception as e:
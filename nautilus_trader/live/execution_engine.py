@@ -393,9 +393,15 @@ class LiveExecutionEngine(ExecutionEngine):
         try:
             while True:
                 command: TradingCommand | None = await self._cmd_queue.get()
+                # Drain any further commands already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while command is not self._sentinel:
+                    self._execute_command(command)
+                    if self._cmd_queue.empty():
+                        break
+                    command = self._cmd_queue.get_nowait()
                 if command is self._sentinel:
                     break
-                self._execute_command(command)
         except asyncio.CancelledError:
             self._log.warning("Command message queue canceled")
         except Exception as e:
@@ -414,9 +420,15 @@ class LiveExecutionEngine(ExecutionEngine):
         try:
             while True:
                 event: OrderEvent | None = await self._evt_queue.get()
+                # Drain any further events already enqueued, amortizing the
+                # per-message task scheduling overhead across the batch
+                while event is not self._sentinel:
+                    self._handle_event(event)
+                    if self._evt_queue.empty():
+                        break
+                    event = self._evt_queue.get_nowait()
                 if event is self._sentinel:
                     break
-                self._handle_event(event)
         except asyncio.CancelledError:
             self._log.warning("Event message queue canceled")
         except Exception as e:
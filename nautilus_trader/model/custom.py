@@ -26,6 +26,12 @@ from nautilus_trader.serialization.arrow.serializer import register_arrow
 from nautilus_trader.serialization.base import register_serializable_type
 
 
+# Shared Encoder/Decoder instances, reused across all custom data classes
+# (msgspec recommends these over the per-call module-level functions)
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+
+
 def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
     def wrapper(cls):  # noqa: C901 (too complex)
         create_init = False
@@ -117,7 +123,7 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
         if "to_bytes" not in cls.__dict__:
 
             def to_bytes(self) -> bytes:
-                return msgspec.msgpack.encode(self.to_dict())
+                return _MSGPACK_ENCODER.encode(self.to_dict())
 
             cls.to_bytes = to_bytes
 
@@ -125,7 +131,7 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
 
             @classmethod
             def from_bytes(cls, data: bytes) -> cls:
-                return cls.from_dict(msgspec.msgpack.decode(data))
+                return cls.from_dict(_MSGPACK_DECODER.decode(data))
 
             cls.from_bytes = from_bytes
 
@@ -199,28 +199,65 @@ cpdef str option_kind_to_str(OptionKind value):
     return cstr_to_pystr(option_kind_to_cstr(value))
 
 
+# Memoization tables for the order-lifecycle enums, which are converted on
+# every order event. Values parse through the Rust FFI once per distinct
+# string, then hit a plain dict lookup.
+cdef dict _ORDER_SIDE_FROM_STR = {}
+cdef dict _ORDER_SIDE_TO_STR = {}
+cdef dict _ORDER_STATUS_FROM_STR = {}
+cdef dict _ORDER_STATUS_TO_STR = {}
+cdef dict _ORDER_TYPE_FROM_STR = {}
+cdef dict _ORDER_TYPE_TO_STR = {}
+cdef dict _TIME_IN_FORCE_FROM_STR = {}
+cdef dict _TIME_IN_FORCE_TO_STR = {}
+
+
 cpdef OrderSide order_side_from_str(str value):
-    return order_side_from_cstr(pystr_to_cstr(value))
+    parsed = _ORDER_SIDE_FROM_STR.get(value)
+    if parsed is None:
+        parsed = order_side_from_cstr(pystr_to_cstr(value))
+        _ORDER_SIDE_FROM_STR[value] = parsed
+    return parsed
 
 
 cpdef str order_side_to_str(OrderSide value):
-    return cstr_to_pystr(order_side_to_cstr(value))
+    cdef str parsed = _ORDER_SIDE_TO_STR.get(value)
+    if parsed is None:
+        parsed = cstr_to_pystr(order_side_to_cstr(value))
+        _ORDER_SIDE_TO_STR[value] = parsed
+    return parsed
 
 
 cpdef OrderStatus order_status_from_str(str value):
-    return order_status_from_cstr(pystr_to_cstr(value))
+    parsed = _ORDER_STATUS_FROM_STR.get(value)
+    if parsed is None:
+        parsed = order_status_from_cstr(pystr_to_cstr(value))
+        _ORDER_STATUS_FROM_STR[value] = parsed
+    return parsed
 
 
 cpdef str order_status_to_str(OrderStatus value):
-    return cstr_to_pystr(order_status_to_cstr(value))
+    cdef str parsed = _ORDER_STATUS_TO_STR.get(value)
+    if parsed is None:
+        parsed = cstr_to_pystr(order_status_to_cstr(value))
+        _ORDER_STATUS_TO_STR[value] = parsed
+    return parsed
 
 
 cpdef OrderType order_type_from_str(str value):
-    return order_type_from_cstr(pystr_to_cstr(value))
+    parsed = _ORDER_TYPE_FROM_STR.get(value)
+    if parsed is None:
+        parsed = order_type_from_cstr(pystr_to_cstr(value))
+        _ORDER_TYPE_FROM_STR[value] = parsed
+    return parsed
 
 
 cpdef str order_type_to_str(OrderType value):
-    return cstr_to_pystr(order_type_to_cstr(value))
+    cdef str parsed = _ORDER_TYPE_TO_STR.get(value)
+    if parsed is None:
+        parsed = cstr_to_pystr(order_type_to_cstr(value))
+        _ORDER_TYPE_TO_STR[value] = parsed
+    return parsed
 
 
 cpdef RecordFlag record_flag_from_str(str value):
@@ -248,11 +285,19 @@ cpdef str price_type_to_str(PriceType value):
 
 
 cpdef TimeInForce time_in_force_from_str(str value):
-    return time_in_force_from_cstr(pystr_to_cstr(value))
+    parsed = _TIME_IN_FORCE_FROM_STR.get(value)
+    if parsed is None:
+        parsed = time_in_force_from_cstr(pystr_to_cstr(value))
+        _TIME_IN_FORCE_FROM_STR[value] = parsed
+    return parsed
 
 
 cpdef str time_in_force_to_str(TimeInForce value):
-    return cstr_to_pystr(time_in_force_to_cstr(value))
+    cdef str parsed = _TIME_IN_FORCE_TO_STR.get(value)
+    if parsed is None:
+        parsed = cstr_to_pystr(time_in_force_to_cstr(value))
+        _TIME_IN_FORCE_TO_STR[value] = parsed
+    return parsed
 
 
 cpdef TradingState trading_state_from_str(str value):
@@ -61,6 +61,11 @@ from nautilus_trader.core.string cimport pystr_to_cstr
 from nautilus_trader.core.string cimport ustr_to_pystr
 
 
+# Instrument ID values repeat heavily on hot parsing paths, so parsed
+# instances are interned and reused (instances are immutable once created)
+cdef dict _INSTRUMENT_ID_CACHE = {}  # type: dict[str, InstrumentId]
+
+
 cdef class Identifier:
     """
     The abstract base class for all identifiers.
@@ -334,6 +339,7 @@ cdef class InstrumentId(Identifier):
         self._mem = instrument_id_from_cstr(
             pystr_to_cstr(state),
         )
+        self._hash = 0
 
     def __eq__(self, InstrumentId other) -> bool:
         if other is None:
@@ -341,7 +347,9 @@ cdef class InstrumentId(Identifier):
         return strcmp(self._mem.symbol._0, other._mem.symbol._0) == 0 and strcmp(self._mem.venue._0, other._mem.venue._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        if self._hash == 0:
+            self._hash = hash(self.to_str())
+        return self._hash
 
     @staticmethod
     cdef InstrumentId from_mem_c(InstrumentId_t mem):
@@ -353,12 +361,17 @@ cdef class InstrumentId(Identifier):
     cdef InstrumentId from_str_c(str value):
         Condition.valid_string(value, "value")
 
+        cdef InstrumentId instrument_id = _INSTRUMENT_ID_CACHE.get(value)
+        if instrument_id is not None:
+            return instrument_id
+
         cdef str parse_err = cstr_to_pystr(instrument_id_check_parsing(pystr_to_cstr(value)))
         if parse_err:
             raise ValueError(parse_err)
 
-        cdef InstrumentId instrument_id = InstrumentId.__new__(InstrumentId)
+        instrument_id = InstrumentId.__new__(InstrumentId)
         instrument_id._mem = instrument_id_from_cstr(pystr_to_cstr(value))
+        _INSTRUMENT_ID_CACHE[value] = instrument_id
         return instrument_id
 
     cdef str to_str(self):
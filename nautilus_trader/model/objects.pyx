@@ -79,6 +79,39 @@ FIXED_SCALAR = RUST_FIXED_SCALAR
 FIXED_PRECISION_BYTES = RUST_PRECISION_BYTES
 
 
+cdef inline uint8_t _precision_from_str(str value):
+    # Infer the decimal precision with a single scan of the string,
+    # deferring scientific notation to the Rust parser
+    if "e" in value or "E" in value:
+        return precision_from_cstr(pystr_to_cstr(value))
+
+    cdef Py_ssize_t dot = value.rfind(".")
+    if dot < 0:
+        return 0
+
+    cdef Py_ssize_t precision = len(value) - dot - 1
+    if precision > RUST_FIXED_PRECISION:
+        raise ValueError(
+            f"invalid `precision` greater than max {RUST_FIXED_PRECISION}, was {precision}"
+        )
+
+    return <uint8_t>precision
+
+
+cdef tuple _POW10 = tuple(10 ** n for n in range(RUST_FIXED_PRECISION + 1))
+
+
+cdef inline object _raw_to_decimal(object raw, uint8_t precision):
+    # Build the Decimal directly from the integer fixed-point raw value when
+    # it is exactly representable at the given precision, avoiding the float
+    # round-trip through string formatting. Returns None when the raw value
+    # carries digits below the precision (only possible via `from_raw`).
+    q, r = divmod(raw, _POW10[RUST_FIXED_PRECISION - precision])
+    if r == 0:
+        return decimal.Decimal(q).scaleb(-<int>precision)
+    return None
+
+
 @cython.auto_pickle(True)
 cdef class Quantity:
     """
@@ -366,7 +399,7 @@ cdef class Quantity:
 
     @staticmethod
     cdef Quantity from_str_c(str value):
-        return Quantity(float(value), precision=precision_from_cstr(pystr_to_cstr(value)))
+        return Quantity(float(value), precision=_precision_from_str(value))
 
     @staticmethod
     cdef Quantity from_int_c(QuantityRaw value):
@@ -509,6 +542,9 @@ cdef class Quantity:
         Decimal
 
         """
+        result = _raw_to_decimal(self._mem.raw, self._mem.precision)
+        if result is not None:
+            return result
         return decimal.Decimal(f"{self.as_f64_c():.{self._mem.precision}f}")
 
     cpdef double as_double(self):
@@ -753,7 +789,7 @@ cdef class Price:
 
     @staticmethod
     cdef Price from_str_c(str value):
-        return Price(float(value), precision=precision_from_cstr(pystr_to_cstr(value)))
+        return Price(float(value), precision=_precision_from_str(value))
 
     @staticmethod
     cdef Price from_int_c(PriceRaw value):
@@ -915,6 +951,9 @@ cdef class Price:
         Decimal
 
         """
+        result = _raw_to_decimal(self._mem.raw, self._mem.precision)
+        if result is not None:
+            return result
         return decimal.Decimal(f"{self.as_f64_c():.{self._mem.precision}f}")
 
     cpdef double as_double(self):
@@ -1249,6 +1288,9 @@ cdef class Money:
         Decimal
 
         """
+        result = _raw_to_decimal(self._mem.raw, self._mem.currency.precision)
+        if result is not None:
+            return result
         return decimal.Decimal(f"{self.as_f64_c():.{self._mem.currency.precision}f}")
 
     cpdef double as_double(self):
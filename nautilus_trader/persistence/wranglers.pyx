@@ -16,6 +16,7 @@
 import random
 from copy import copy
 
+import cython
 import numpy as np
 import pandas as pd
 
@@ -711,6 +712,8 @@ cdef class BarDataWrangler:
         self.bar_type = bar_type
         self.instrument = instrument
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def process(
         self,
         data: pd.DataFrame,
@@ -755,12 +758,34 @@ cdef class BarDataWrangler:
 
         ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
 
-        return list(map(
-            self._build_bar,
-            data.values,
-            ts_events,
-            ts_inits
-        ))
+        # Extract each column once into a contiguous array (SoA layout) rather
+        # than slicing a fresh row ndarray out of `data.values` per bar
+        cdef const double[:] opens = data["open"].to_numpy(dtype=np.float64)
+        cdef const double[:] highs = data["high"].to_numpy(dtype=np.float64)
+        cdef const double[:] lows = data["low"].to_numpy(dtype=np.float64)
+        cdef const double[:] closes = data["close"].to_numpy(dtype=np.float64)
+        cdef const double[:] volumes = data["volume"].to_numpy(dtype=np.float64)
+        cdef const uint64_t[:] ts_events_view = ts_events
+        cdef const uint64_t[:] ts_inits_view = ts_inits
+
+        cdef uint8_t price_precision = self.instrument.price_precision
+        cdef uint8_t size_precision = self.instrument.size_precision
+
+        cdef list[Bar] bars = []
+        cdef Py_ssize_t i
+        for i in range(len(opens)):
+            bars.append(Bar(
+                bar_type=self.bar_type,
+                open=Price(opens[i], price_precision),
+                high=Price(highs[i], price_precision),
+                low=Price(lows[i], price_precision),
+                close=Price(closes[i], price_precision),
+                volume=Quantity(volumes[i], size_precision),
+                ts_event=ts_events_view[i],
+                ts_init=ts_inits_view[i],
+            ))
+
+        return bars
 
     # cpdef method for Python wrap() (called with map)
     cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init):
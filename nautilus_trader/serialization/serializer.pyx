@@ -13,16 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import re
 from typing import Any
 
 from libc.stdint cimport uint64_t
 
-import pandas as pd
-import pytz
 from msgspec import msgpack
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport iso8601_to_unix_nanos
+from nautilus_trader.core.datetime cimport unix_nanos_to_iso8601
 from nautilus_trader.serialization.base cimport _OBJECT_FROM_DICT_MAP
 from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
 from nautilus_trader.serialization.base cimport Serializer
@@ -53,8 +52,13 @@ cdef class MsgSpecSerializer(Serializer):
         bint timestamps_as_str = False,
         bint timestamps_as_iso8601 = False,
     ):
-        self._encode = encoding.encode
-        self._decode = encoding.decode
+        # Reuse a single Encoder/Decoder pair when the encoding module provides
+        # them (msgspec recommends reusing instances over the per-call
+        # module-level convenience functions)
+        encoder_cls = getattr(encoding, "Encoder", None)
+        decoder_cls = getattr(encoding, "Decoder", None)
+        self._encode = encoder_cls().encode if encoder_cls is not None else encoding.encode
+        self._decode = decoder_cls().decode if decoder_cls is not None else encoding.decode
         self.timestamps_as_str = timestamps_as_str
         self.timestamps_as_iso8601 = timestamps_as_iso8601
 
@@ -91,21 +95,19 @@ cdef class MsgSpecSerializer(Serializer):
                     raise RuntimeError(f"cannot serialize object: unrecognized type {type(obj)}")
             obj_dict = delegate(obj)
 
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
-
+        # Single pass over the items, dispatching on the key prefix directly
+        # rather than building an intermediate dict with per-key regex matching
         cdef str key
         if self.timestamps_as_iso8601:
-            for key, value in timestamp_kvs.items():
-                if value is None:
+            for key, value in obj_dict.items():
+                if value is None or not (key.startswith("ts_") or key == "expire_time_ns"):
                     continue
-                timestamp = pd.Timestamp(value, unit="ns", tz=pytz.utc)
-                obj_dict[key] = timestamp.isoformat().replace("+00:00", "Z")
+                obj_dict[key] = unix_nanos_to_iso8601(value)
         elif self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
-                if value is not None:
-                    obj_dict[key] = str(value)
+            for key, value in obj_dict.items():
+                if value is None or not (key.startswith("ts_") or key == "expire_time_ns"):
+                    continue
+                obj_dict[key] = str(value)
 
         return self._encode(obj_dict)
 
@@ -131,22 +133,19 @@ cdef class MsgSpecSerializer(Serializer):
         Condition.not_none(obj_bytes, "obj_bytes")
 
         cdef dict obj_dict = self._decode(obj_bytes)  # type: dict[str, Any]
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
 
         cdef:
             str key
             uint64_t value_uint64
         if self.timestamps_as_iso8601 or self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
-                if value is None:
+            for key, value in obj_dict.items():
+                if value is None or not (key.startswith("ts_") or key == "expire_time_ns"):
                     continue
-                if re.match(r"^\d+$", value):  # Check if value is an integer-like string
+                if value.isdigit():  # Check if value is an integer-like string
                     value_uint64 = int(value)
                     obj_dict[key] = value_uint64
                 else:  # Else assume the value is ISO 8601 format
-                    value_uint64 = pd.Timestamp(value, tz=pytz.utc).value
+                    value_uint64 = iso8601_to_unix_nanos(value)
                     obj_dict[key] = value_uint64
 
         cdef str obj_type = obj_dict.get("type")
@@ -224,6 +224,18 @@ class TestTradingNodeOperation:
         assert isinstance(loop, asyncio.AbstractEventLoop)
         assert loop == node.kernel.loop
 
+    def test_uvloop_event_loop_policy_installed(self):
+        # Arrange
+        uvloop = pytest.importorskip("uvloop")
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        # Act: importing the kernel module installs the uvloop policy
+        policy = asyncio.get_event_loop_policy()
+
+        # Assert
+        assert isinstance(policy, uvloop.EventLoopPolicy)
+
     def test_build_called_twice_raises_runtime_error(self):
         # Arrange, # Act
         with pytest.raises(RuntimeError):
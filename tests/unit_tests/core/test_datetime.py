@@ -27,6 +27,7 @@ from nautilus_trader.core.datetime import format_iso8601
 from nautilus_trader.core.datetime import is_datetime_utc
 from nautilus_trader.core.datetime import is_tz_aware
 from nautilus_trader.core.datetime import is_tz_naive
+from nautilus_trader.core.datetime import iso8601_to_unix_nanos
 from nautilus_trader.core.datetime import maybe_dt_to_unix_nanos
 from nautilus_trader.core.datetime import maybe_unix_nanos_to_dt
 from nautilus_trader.core.datetime import micros_to_nanos
@@ -307,6 +308,30 @@ class TestDatetimeFunctions:
         assert is_tz_naive(time_object1) is True
         assert is_tz_naive(time_object2) is True
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "1970-01-01T00:00:00Z",
+            "1970-01-01T00:00:00.000Z",
+            "2021-09-14T13:59:46.123456789Z",
+            "2024-02-29T23:59:59.999Z",
+            "2100-12-31T00:00:00.1Z",
+            "1970-01-01T00:00:00+00:00",  # Falls back to pandas parsing
+            "2021-09-14 13:59:46",  # Falls back to pandas parsing
+        ],
+    )
+    def test_iso8601_to_unix_nanos_with_various_values(self, value):
+        # Arrange, Act
+        result = iso8601_to_unix_nanos(value)
+
+        # Assert
+        assert result == pd.Timestamp(value, tz=pytz.utc).value
+
+    def test_iso8601_to_unix_nanos_with_invalid_date_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            iso8601_to_unix_nanos("2021-02-30T00:00:00.000Z")
+
     def test_format_iso8601(self):
         # Arrange
         dt1 = UNIX_EPOCH
@@ -37,6 +37,22 @@ class TestUUID:
         with pytest.raises(ValueError):
             UUID4.from_str(value)
 
+    @pytest.mark.parametrize(
+        ("value"),
+        [
+            "2d89666b-1a1e-4a75-b193-4eb3b454c757",  # Canonical
+            "2d89666b1a1e4a75b1934eb3b454c757",  # Plain hex
+            "{2d89666b-1a1e-4a75-b193-4eb3b454c757}",  # Braced
+            "urn:uuid:2d89666b-1a1e-4a75-b193-4eb3b454c757",  # URN
+        ],
+    )
+    def test_from_str_accepted_forms(self, value: str):
+        # Arrange, Act
+        uuid = UUID4.from_str(value)
+
+        # Assert
+        assert uuid.value == "2d89666b-1a1e-4a75-b193-4eb3b454c757"
+
     def test_pickling_round_trip(self):
         # Arrange
         uuid = UUID4()
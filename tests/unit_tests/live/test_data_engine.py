@@ -353,3 +353,32 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_drains_queue_in_batch(self):
+        # Arrange: count completed queue wakeups to observe the batching
+        original_get = self.engine._data_queue.get
+        wakeups = 0
+
+        async def counting_get():
+            nonlocal wakeups
+            data = await original_get()
+            wakeups += 1
+            return data
+
+        self.engine._data_queue.get = counting_get
+        self.engine.start()
+
+        tick = TestDataStubs.trade_tick()
+
+        # Act
+        for _ in range(10):
+            self.engine.process(tick)
+
+        # Assert
+        await eventually(lambda: self.engine.data_qsize() == 0)
+        await eventually(lambda: self.engine.data_count == 10)
+        assert wakeups == 1  # All ten ticks serviced by a single awaited get
+
+        # Tear Down
+        self.engine.stop()
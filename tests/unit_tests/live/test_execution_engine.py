@@ -395,6 +395,62 @@ class TestLiveExecutionEngine:
         # Tear Down
         self.exec_engine.stop()
 
+    @pytest.mark.asyncio()
+    async def test_execute_commands_drains_queue_in_batch(self):
+        # Arrange: count completed queue wakeups to observe the batching
+        original_get = self.exec_engine._cmd_queue.get
+        wakeups = 0
+
+        async def counting_get():
+            nonlocal wakeups
+            command = await original_get()
+            wakeups += 1
+            return command
+
+        self.exec_engine._cmd_queue.get = counting_get
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        def submit_order_command():
+            order = strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            return SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            )
+
+        # The queue task started awaiting before the patch was applied, so
+        # prime it with one command to re-arm it through the counting wrapper
+        self.exec_engine.execute(submit_order_command())
+        await eventually(lambda: self.exec_engine.command_count == 1)
+        assert wakeups == 0
+
+        # Act: enqueue multiple commands before yielding to the queue task
+        for _ in range(10):
+            self.exec_engine.execute(submit_order_command())
+
+        # Assert
+        await eventually(lambda: self.exec_engine.command_count == 11)
+        await eventually(lambda: self.exec_engine.cmd_qsize() == 0)
+        assert wakeups == 1  # All ten commands serviced by a single awaited get
+
+        # Tear Down
+        self.exec_engine.stop()
+
     @pytest.mark.asyncio
     async def test_handle_order_status_report(self):
         # Arrange
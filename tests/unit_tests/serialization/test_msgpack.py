@@ -17,6 +17,7 @@ from base64 import b64encode
 from decimal import Decimal
 
 import msgspec
+import pytest
 
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.enums import ComponentState
@@ -96,6 +97,10 @@ BTCUSDT_220325 = TestInstrumentProvider.btcusdt_future_binance()
 
 
 class TestMsgSpecSerializer:
+    # The serializer is stateless so a single instance is shared across all
+    # tests, which also models how production code should reuse one serializer
+    serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+
     def setup(self):
         # Fixture Setup
         self.trader_id = TestIdStubs.trader_id()
@@ -110,8 +115,6 @@ class TestMsgSpecSerializer:
             clock=TestClock(),
         )
 
-        self.serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
-
     def test_serialize_and_deserialize_fx_instrument(self):
         # Arrange, Act
         serialized = self.serializer.serialize(AUDUSD_SIM)
@@ -921,78 +924,29 @@ class TestMsgSpecSerializer:
         # Assert
         assert deserialized == event
 
-    def test_serialize_and_deserialize_order_accepted_events(self):
-        # Arrange
-        event = OrderAccepted(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            VenueOrderId("B-123456"),
-            self.account_id,
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
-    def test_serialize_and_deserialize_order_rejected_events(self):
-        # Arrange
-        event = OrderRejected(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            self.account_id,
-            "ORDER_ID_INVALID",
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
-    def test_serialize_and_deserialize_order_pending_cancel_events(self):
-        # Arrange
-        event = OrderPendingCancel(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            VenueOrderId("1"),
-            self.account_id,
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
-    def test_serialize_and_deserialize_order_pending_replace_events(self):
+    @pytest.mark.parametrize(
+        ("event_cls", "extra_args"),
+        [
+            (OrderAccepted, ()),
+            (OrderPendingCancel, ()),
+            (OrderPendingUpdate, ()),
+            (OrderCanceled, ()),
+            (OrderExpired, ()),
+            (OrderTriggered, ()),
+            (OrderModifyRejected, ("ORDER_DOES_NOT_EXIST",)),
+            (OrderCancelRejected, ("ORDER_DOES_NOT_EXIST",)),
+        ],
+    )
+    def test_serialize_and_deserialize_order_events(self, event_cls, extra_args):
         # Arrange
-        event = OrderPendingUpdate(
+        event = event_cls(
             self.trader_id,
             self.strategy_id,
             AUDUSD_SIM.id,
             ClientOrderId("O-123456"),
             VenueOrderId("1"),
             self.account_id,
+            *extra_args,
             UUID4(),
             0,
             0,
@@ -1005,59 +959,59 @@ class TestMsgSpecSerializer:
         # Assert
         assert deserialized == event
 
-    def test_serialize_and_deserialize_order_canceled_events(self):
+    @pytest.mark.parametrize(
+        ("serializer", "expected_ts_event", "expected_ts_init"),
+        [
+            (
+                MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_iso8601=True),
+                "1970-01-01T00:00:01.000000000Z",
+                "1970-01-01T00:00:02.000000000Z",
+            ),
+            (
+                MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+                "1000000000",
+                "2000000000",
+            ),
+        ],
+    )
+    def test_serialize_and_deserialize_with_timestamp_flags(
+        self,
+        serializer,
+        expected_ts_event,
+        expected_ts_init,
+    ):
         # Arrange
-        event = OrderCanceled(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            VenueOrderId("1"),
-            self.account_id,
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
-    def test_serialize_and_deserialize_order_update_reject_events(self):
-        # Arrange
-        event = OrderModifyRejected(
+        event = OrderAccepted(
             self.trader_id,
             self.strategy_id,
             AUDUSD_SIM.id,
             ClientOrderId("O-123456"),
             VenueOrderId("1"),
             self.account_id,
-            "ORDER_DOES_NOT_EXIST",
             UUID4(),
-            0,
-            0,
+            1_000_000_000,
+            2_000_000_000,
         )
 
         # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
+        serialized = serializer.serialize(event)
+        deserialized = serializer.deserialize(serialized)
 
         # Assert
+        decoded = msgspec.msgpack.decode(serialized)
+        assert decoded["ts_event"] == expected_ts_event
+        assert decoded["ts_init"] == expected_ts_init
         assert deserialized == event
 
-    def test_serialize_and_deserialize_order_cancel_reject_events(self):
+    def test_serialize_and_deserialize_order_rejected_events(self):
         # Arrange
-        event = OrderCancelRejected(
+        event = OrderRejected(
             self.trader_id,
             self.strategy_id,
             AUDUSD_SIM.id,
             ClientOrderId("O-123456"),
-            VenueOrderId("1"),
             self.account_id,
-            "ORDER_DOES_NOT_EXIST",
+            "ORDER_ID_INVALID",
             UUID4(),
             0,
             0,
@@ -1094,48 +1048,6 @@ class TestMsgSpecSerializer:
         # Assert
         assert deserialized == event
 
-    def test_serialize_and_deserialize_order_expired_events(self):
-        # Arrange
-        event = OrderExpired(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            VenueOrderId("1"),
-            self.account_id,
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
-    def test_serialize_and_deserialize_order_triggered_events(self):
-        # Arrange
-        event = OrderTriggered(
-            self.trader_id,
-            self.strategy_id,
-            AUDUSD_SIM.id,
-            ClientOrderId("O-123456"),
-            VenueOrderId("1"),
-            self.account_id,
-            UUID4(),
-            0,
-            0,
-        )
-
-        # Act
-        serialized = self.serializer.serialize(event)
-        deserialized = self.serializer.deserialize(serialized)
-
-        # Assert
-        assert deserialized == event
-
     def test_serialize_and_deserialize_order_partially_filled_events(self):
         # Arrange
         event = OrderFilled(